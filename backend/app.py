@@ -1,15 +1,27 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, Response
+from flask.helpers import get_debug_flag
 from flask_cors import CORS
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import logging
+import time
+import threading
+import heapq
+import math
+from datetime import datetime, timedelta, timezone
 from langchain_groq import ChatGroq
 from langchain.prompts import ChatPromptTemplate
-from langchain.schema import StrOutputParser
-import json
+from langchain.schema import StrOutputParser, SystemMessage
+import orjson
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, Future
+from collections import OrderedDict, Counter
 
 app = Flask(__name__)
 CORS(app)
+logger = logging.getLogger(__name__)
 load_dotenv() 
 try:
     api_key = os.getenv("GROQ_API_KEY")
@@ -22,179 +34,516 @@ try:
         api_key=api_key 
     )
 except Exception as e:
-    print(f"Warning: Groq LLM initialization failed: {e}")
-    print("API descriptions will use fallback method")
+    logger.warning("Groq LLM initialization failed: %s", e)
+    logger.warning("API descriptions will use fallback method")
     llm = None
 
+# Static instructions live in a byte-identical system message (no placeholders,
+# fixed whitespace) so Groq can reuse the cached prompt prefix across calls;
+# only the trailing user message varies per project
+DESCRIPTION_SYSTEM_PROMPT = (
+    "You are an expert CV writer helping a fresh graduate describe their GitHub projects in a professional way.\n"
+    "Create a concise, impressive description for this project that:\n"
+    "1. Highlights technical skills and languages used\n"
+    "2. Emphasizes accomplishments and impact\n"
+    "3. Uses strong action verbs\n"
+    "4. Is 2-3 sentences long\n"
+    "5. Is suitable for a professional CV/Resume\n"
+    "Make it sound professional but honest, and focus on the most relevant aspects for an employer."
+)
+DESCRIPTION_USER_PROMPT = (
+    "Project details:\n"
+    "Name: {name}\n"
+    "Main language: {language}\n"
+    "Description: {description}\n"
+    "Stars: {stars}\n"
+    "Forks: {forks}\n"
+    "Created: {created_at}\n"
+    "Last updated: {updated_at}\n"
+    "Related projects by this developer using same language: {related_projects_count}\n"
+    "\n"
+    "Write a professional, concise project description for a CV:"
+)
+
+# Prompt and chain are built once at startup instead of on every description
+DESCRIPTION_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessage(content=DESCRIPTION_SYSTEM_PROMPT),
+    ("user", DESCRIPTION_USER_PROMPT)
+])
+# Descriptions are 2-3 sentences, so cap generation instead of running to the model default.
+# No stop sequence: the model often opens with a preamble line followed by a blank line
+DESCRIPTION_MAX_TOKENS = 120
+description_chain = (
+    DESCRIPTION_PROMPT | llm.bind(max_tokens=DESCRIPTION_MAX_TOKENS) | StrOutputParser()
+    if llm else None
+)
+
+# Worker pool for the per-request LLM description calls (GitHub calls use their own pool)
+executor = ThreadPoolExecutor(max_workers=16)
+
+# Pooled HTTP session so keep-alive connections to GitHub are reused across requests
+GITHUB_TIMEOUT = (3, 10)
+session = requests.Session()
+session.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    # Return the final 5xx instead of raising RetryError so raise_for_status() handles it
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+))
+
+# Redis cache for serialized profile responses; run the server with
+# maxmemory-policy allkeys-lfu so hot usernames survive eviction
+PROFILE_CACHE_TTL = 30 * 60
+PROFILE_CACHE_RETENTION = 24 * 60 * 60  # Keep stale copies as a fallback when GitHub fails
+REDIS_TIMEOUT = 0.5  # Seconds; an unreachable cache must not stall requests before GitHub
+try:
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        raise ValueError("REDIS_URL not found in environment or .env file")
+    
+    import redis
+    cache = redis.Redis(connection_pool=redis.ConnectionPool.from_url(
+        redis_url,
+        socket_timeout=REDIS_TIMEOUT,
+        socket_connect_timeout=REDIS_TIMEOUT
+    ))
+    cache.ping()
+except Exception as e:
+    logger.warning("Redis cache initialization failed: %s", e)
+    logger.warning("GitHub profile responses will not be cached")
+    cache = None
+
+def ojsonify(obj, status=200):
+    """Build a JSON response serialized with orjson"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def get_cached_profile(username):
+    """Return the cached profile entry for a username, or None"""
+    if not cache:
+        return None
+    try:
+        entry = cache.hgetall(f"github-profile:{username.lower()}")
+    except redis.RedisError as e:
+        logger.warning("Redis cache read failed: %s", e)
+        return None
+    if not entry:
+        return None
+    try:
+        return {
+            'generated_at': float(entry[b'generated_at']),
+            'stale_at': float(entry[b'stale_at']),
+            'status': int(entry[b'status']),
+            'body': entry[b'body']
+        }
+    except (KeyError, ValueError) as e:
+        # Treat partial or malformed entries as a miss; the next success overwrites them
+        logger.warning("Ignoring malformed cache entry for %s: %s", username, e)
+        return None
+
+def set_cached_profile(username, status, body):
+    """Store a serialized profile response for a username"""
+    if not cache:
+        return
+    key = f"github-profile:{username.lower()}"
+    now = time.time()
+    try:
+        pipe = cache.pipeline()
+        pipe.hset(key, mapping={
+            'generated_at': now,
+            'stale_at': now + PROFILE_CACHE_TTL,
+            'status': status,
+            'body': body
+        })
+        pipe.expire(key, PROFILE_CACHE_RETENTION)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("Redis cache write failed: %s", e)
+
+def budget_exhausted_response(error):
+    """Build a 429 response telling the client when our GitHub budget allows a retry"""
+    response = ojsonify({'error': str(error)}, 429)
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def cached_response(entry):
+    """Build a response directly from a cached profile entry"""
+    return Response(entry['body'], status=entry['status'], mimetype='application/json')
+
+# Per-URL (etag, body) cache for conditional GitHub requests; 304s don't count
+# against the rate limit, and the quota is tracked so we can stop asking when low
+ETAG_CACHE_SIZE = 1024
+RATE_LIMIT_RESERVE = 10
+etag_cache = OrderedDict()
+etag_lock = threading.Lock()
+github_rate_limit = {'remaining': None, 'reset': 0, 'limit': None}
+
+# Repository fields read by the backend or the CV frontend; this is also the repo
+# shape the API returns, as everything else is dropped before caching and serializing
+REPO_FIELDS = (
+    'id', 'name', 'language', 'description', 'stargazers_count', 'forks_count',
+    'created_at', 'updated_at', 'homepage', 'html_url'
+)
+
+# Pace our own GitHub traffic so a burst of users can't exhaust the rate limit.
+# GitHub calls run on a dedicated pool, so waiting on GitHub never occupies the
+# workers the LLM calls need. Each call also takes a token from a bucket whose
+# refill rate spreads the remaining quota evenly over the time left until it resets.
+GITHUB_CONCURRENCY = 8  # Parallel GitHub requests across all users
+GITHUB_BURST = 10  # Requests allowed back to back before pacing applies
+GITHUB_DEFAULT_LIMIT = 60  # Unauthenticated hourly quota, assumed until GitHub reports ours
+GITHUB_MAX_WAIT = 5  # Seconds a request may wait for budget before failing fast
+github_executor = ThreadPoolExecutor(max_workers=GITHUB_CONCURRENCY)
+github_bucket = {'tokens': GITHUB_BURST, 'updated': time.monotonic()}
+github_bucket_lock = threading.Lock()
+inflight_profiles = {}
+inflight_lock = threading.Lock()
+
+def github_refill_rate():
+    """Return the tokens per second that spread the remaining GitHub quota until it resets"""
+    with etag_lock:
+        remaining = github_rate_limit['remaining']
+        reset = github_rate_limit['reset']
+        limit = github_rate_limit['limit'] or GITHUB_DEFAULT_LIMIT
+    seconds_left = reset - time.time()
+    if remaining is None or seconds_left <= 0:
+        # Quota not reported yet, or the window has reset: assume the full hourly limit
+        return limit / 3600
+    return max(remaining - RATE_LIMIT_RESERVE, 0) / seconds_left
+
+class GitHubBudgetExhausted(Exception):
+    """Raised when our own GitHub request budget has no token available in time"""
+    def __init__(self, retry_after):
+        super().__init__("GitHub request budget exhausted, try again later")
+        self.retry_after = retry_after
+
+def acquire_github_token():
+    """Take a token from the GitHub request budget, raising GitHubBudgetExhausted if none is available in time"""
+    deadline = time.monotonic() + GITHUB_MAX_WAIT
+    while True:
+        rate = github_refill_rate()
+        with github_bucket_lock:
+            now = time.monotonic()
+            elapsed = now - github_bucket['updated']
+            github_bucket['tokens'] = min(GITHUB_BURST, github_bucket['tokens'] + elapsed * rate)
+            github_bucket['updated'] = now
+            if github_bucket['tokens'] >= 1:
+                github_bucket['tokens'] -= 1
+                return
+            delay = (1 - github_bucket['tokens']) / rate if rate > 0 else float('inf')
+        if now + delay > deadline:
+            if delay == float('inf'):
+                # No quota left this window; retry once GitHub resets it
+                with etag_lock:
+                    delay = github_rate_limit['reset'] - time.time()
+            raise GitHubBudgetExhausted(max(math.ceil(delay), 1))
+        time.sleep(delay)
+
+def charge_github_token():
+    """Debit a request GitHub counted after the fact, letting the bucket go into debt"""
+    rate = github_refill_rate()
+    with github_bucket_lock:
+        now = time.monotonic()
+        elapsed = now - github_bucket['updated']
+        github_bucket['tokens'] = min(GITHUB_BURST, github_bucket['tokens'] + elapsed * rate) - 1
+        github_bucket['updated'] = now
+
+def fetch_json(url, fields=None):
+    """Fetch a GitHub API URL and return the decoded JSON body, optionally trimming list items to fields"""
+    with etag_lock:
+        cached = etag_cache.get(url)
+        if cached:
+            etag_cache.move_to_end(url)
+        remaining = github_rate_limit['remaining']
+        quota_low = remaining is not None and remaining < RATE_LIMIT_RESERVE and github_rate_limit['reset'] > time.time()
+    
+    # Short-circuit to cached data while the rate limit is nearly exhausted
+    if cached and quota_low:
+        return cached[1]
+    
+    # Conditional requests usually come back 304, which GitHub doesn't count against
+    # the quota, so only unconditional requests wait for budget up front
+    if not cached:
+        acquire_github_token()
+    
+    headers = {'If-None-Match': cached[0]} if cached else {}
+    response = session.get(url, headers=headers, timeout=GITHUB_TIMEOUT)
+    
+    with etag_lock:
+        if 'X-RateLimit-Remaining' in response.headers:
+            github_rate_limit['remaining'] = int(response.headers['X-RateLimit-Remaining'])
+            github_rate_limit['reset'] = int(response.headers.get('X-RateLimit-Reset', 0))
+            github_rate_limit['limit'] = int(response.headers.get('X-RateLimit-Limit', GITHUB_DEFAULT_LIMIT))
+    
+    if response.status_code == 304 and cached:
+        return cached[1]
+    
+    # The revalidation returned a full response, which GitHub does count
+    if cached:
+        charge_github_token()
+    
+    response.raise_for_status()
+    body = orjson.loads(response.content)
+    if fields:
+        body = [{key: item[key] for key in fields if key in item} for item in body]
+    
+    etag = response.headers.get('ETag')
+    if etag:
+        with etag_lock:
+            etag_cache[url] = (etag, body)
+            etag_cache.move_to_end(url)
+            if len(etag_cache) > ETAG_CACHE_SIZE:
+                etag_cache.popitem(last=False)
+    return body
+
+def parse_github_date(value):
+    """Parse a GitHub ISO 8601 timestamp into an aware UTC datetime"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+def repo_score(repo):
+    """Score a repository by stars (weight 3) plus normalized recency"""
+    stars = repo.get('stargazers_count', 0) * 3
+    updated_date = repo.get('updated_at', '')
+    # Simple numeric representation of date for sorting
+    date_score = 0
+    if updated_date:
+        try:
+            date_score = parse_github_date(updated_date).timestamp() / 1000000  # Normalize to comparable scale
+        except ValueError:
+            pass
+    return stars + date_score
+
+def fetch_github_data(github_username):
+    """Fetch a user's profile and repositories, returning language counts, per-language totals and top repos"""
+    # Fetch user data and repositories in parallel
+    user_url = f"https://api.github.com/users/{github_username}"
+    repos_url = f"https://api.github.com/users/{github_username}/repos?sort=updated&per_page=100"
+    user_future = github_executor.submit(fetch_json, user_url)
+    repos_future = github_executor.submit(fetch_json, repos_url, REPO_FIELDS)
+    user_data = user_future.result()
+    repos_data = repos_future.result()
+    
+    # Count repos per language in a single pass; repos without a language are
+    # counted under None for related-project counts but not reported as a language
+    language_totals = Counter(repo.get('language') for repo in repos_data)
+    language_counts = {lang: count for lang, count in language_totals.items() if lang}
+    
+    # Select top repositories by a combined score of stars and recency
+    top_repos = heapq.nlargest(5, repos_data, key=repo_score)  # Get top 5 for more options
+    
+    return user_data, language_counts, language_totals, top_repos
+
+def get_github_data(github_username):
+    """Fetch GitHub data for a user, sharing the result with concurrent requests for the same user"""
+    key = github_username.lower()
+    with inflight_lock:
+        future = inflight_profiles.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            inflight_profiles[key] = future
+    
+    # Another request is already fetching this user, wait for its result
+    if not is_leader:
+        return future.result()
+    
+    try:
+        result = fetch_github_data(github_username)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with inflight_lock:
+            inflight_profiles.pop(key, None)
+
 @app.route('/api/github-profile', methods=['GET'])
 def get_github_profile():
     """Fetch GitHub profile data for a user"""
     github_username = request.args.get('username')
     
     if not github_username:
-        return jsonify({'error': 'GitHub username is required'}), 400
+        return ojsonify({'error': 'GitHub username is required'}, 400)
+    
+    # Serve fresh cache hits without touching GitHub or Groq
+    cached = get_cached_profile(github_username)
+    if cached and cached['stale_at'] > time.time():
+        return cached_response(cached)
     
     try:
-        # Fetch user data
-        user_url = f"https://api.github.com/users/{github_username}"
-        user_response = requests.get(user_url)
-        user_response.raise_for_status()
-        user_data = user_response.json()
-        
-        # Fetch repositories
-        repos_url = f"https://api.github.com/users/{github_username}/repos?sort=updated&per_page=100"
-        repos_response = requests.get(repos_url)
-        repos_response.raise_for_status()
-        repos_data = repos_response.json()
-        
-        # Extract languages from repos
-        language_counts = {}
-        for repo in repos_data:
-            lang = repo.get('language')
-            if lang:
-                language_counts[lang] = language_counts.get(lang, 0) + 1
-        
-        # Sort repositories by a combined score of stars and recency
-        for repo in repos_data:
-            # Calculate score: stars (weight 3) + recency (normalized)
-            stars = repo.get('stargazers_count', 0) * 3
-            updated_date = repo.get('updated_at', '')
-            # Simple numeric representation of date for sorting
-            date_score = 0
-            if updated_date:
-                # Convert date string to timestamp value
-                from datetime import datetime
-                try:
-                    dt = datetime.strptime(updated_date, "%Y-%m-%dT%H:%M:%SZ")
-                    date_score = dt.timestamp() / 1000000  # Normalize to comparable scale
-                except:
-                    pass
-            
-            repo['score'] = stars + date_score
-        
-        # Sort repos by score (descending)
-        sorted_repos = sorted(repos_data, key=lambda x: x.get('score', 0), reverse=True)
-        
-        # Select top repositories
-        top_repos = sorted_repos[:5]  # Get top 5 for more options
+        user_data, language_counts, language_totals, top_repos = get_github_data(github_username)
         
-        # Add enhanced descriptions to top repositories
-        top_repos_with_descriptions = []
-        for i, repo in enumerate(top_repos):
-            if i < 2:  # Process only top 2 for the CV
-                enhanced_description = generate_project_description(repo, repos_data)
-                repo_with_description = {**repo, 'enhanced_description': enhanced_description}
-                top_repos_with_descriptions.append(repo_with_description)
+        # Add enhanced descriptions to top repositories, generating them in parallel
+        cv_repos = top_repos[:2]  # Process only top 2 for the CV
+        results = list(executor.map(lambda repo: generate_project_description(repo, language_totals), cv_repos))
+        top_repos_with_descriptions = [
+            {**repo, 'enhanced_description': enhanced_description}
+            for repo, (enhanced_description, llm_failed) in zip(cv_repos, results)
+        ]
         
-        return jsonify({
+        response = ojsonify({
             'user_data': user_data,
             'top_repos': top_repos_with_descriptions,
             'languages': language_counts
         })
+        # Don't pin template text from a transient Groq failure in the cache
+        if not any(llm_failed for _, llm_failed in results):
+            set_cached_profile(github_username, response.status_code, response.get_data())
+        return response
         
     except requests.exceptions.HTTPError as e:
-        return jsonify({'error': f'GitHub API error: {str(e)}'}), 404
+        # Fall back to the last known good response if we have one
+        if cached:
+            return cached_response(cached)
+        return ojsonify({'error': f'GitHub API error: {str(e)}'}, 404)
+    except GitHubBudgetExhausted as e:
+        if cached:
+            return cached_response(cached)
+        return budget_exhausted_response(e)
     except Exception as e:
-        return jsonify({'error': f'Error fetching GitHub data: {str(e)}'}), 500
+        if cached:
+            return cached_response(cached)
+        return ojsonify({'error': f'Error fetching GitHub data: {str(e)}'}, 500)
 
-def generate_project_description(project, all_repos):
-    """Generate enhanced description for a project using LangChain and Groq"""
-    
-    # Extract relevant project data
-    project_data = {
+# LLM descriptions memoized per repo id and prompt context, shared by the
+# buffered and streaming endpoints; failures are never stored
+DESCRIPTION_CACHE_SIZE = 2048
+description_cache = OrderedDict()
+description_lock = threading.Lock()
+
+def get_cached_description(key):
+    """Return a memoized LLM description, or None"""
+    with description_lock:
+        description = description_cache.get(key)
+        if description is not None:
+            description_cache.move_to_end(key)
+        return description
+
+def set_cached_description(key, description):
+    """Memoize an LLM description, evicting the least recently used entry"""
+    with description_lock:
+        description_cache[key] = description
+        description_cache.move_to_end(key)
+        if len(description_cache) > DESCRIPTION_CACHE_SIZE:
+            description_cache.popitem(last=False)
+
+def description_cache_key(repo_id, context):
+    """Build the memo key for a repo's description from its id and prompt context"""
+    return (repo_id, tuple(context.items()))
+
+def describe_project(repo_id, context):
+    """Generate a project description with the LLM, memoized per repo id and prompt context"""
+    key = description_cache_key(repo_id, context)
+    description = get_cached_description(key)
+    if description is None:
+        description = description_chain.invoke(context).strip()
+        # Never memoize an empty completion; raising sends the caller to the fallback
+        if not description:
+            raise ValueError("LLM returned an empty description")
+        set_cached_description(key, description)
+    return description
+
+def description_context(project, language_totals):
+    """Build the prompt variables for a project description"""
+    language = project.get('language', 'various technologies')
+    return {
         'name': project.get('name', ''),
-        'language': project.get('language', 'various technologies'),
+        'language': language,
         'description': project.get('description', 'software project'),
         'stars': project.get('stargazers_count', 0),
         'forks': project.get('forks_count', 0),
         'created_at': project.get('created_at', ''),
         'updated_at': project.get('updated_at', ''),
-        'homepage': project.get('homepage', ''),
-        'is_fork': project.get('fork', False),
-        'topics': project.get('topics', []),
+        # Count the other repositories in the same language (excluding this one)
+        'related_projects_count': max(language_totals[language] - 1, 0)
     }
-    
-    # Get similar repositories by language
-    related_repos = [
-        repo for repo in all_repos 
-        if repo.get('language') == project_data['language'] and repo['id'] != project['id']
-    ]
-    expertise_level = len(related_repos)
+
+def generate_project_description(project, language_totals):
+    """Generate enhanced description for a project using LangChain and Groq
+
+    Returns (description, llm_failed); llm_failed is True when the LLM was
+    available but errored and the template fallback was used instead.
+    """
+    context = description_context(project, language_totals)
     
     # If LLM is available, use it for description generation
-    if llm:
+    if description_chain:
         try:
-            # Create context for LLM
-            context = {
-                **project_data,
-                'related_projects_count': expertise_level,
-                'has_expertise': expertise_level > 2
-            }
-            
-            # Build prompt
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", """You are an expert CV writer helping a fresh graduate describe their GitHub projects in a professional way.
-                Create a concise, impressive description for this project that:
-                1. Highlights technical skills and languages used
-                2. Emphasizes accomplishments and impact
-                3. Uses strong action verbs
-                4. Is 2-3 sentences long
-                5. Is suitable for a professional CV/Resume
-                Make it sound professional but honest, and focus on the most relevant aspects for an employer.
-                """),
-                ("user", """Project details:
-                Name: {name}
-                Main language: {language}
-                Description: {description}
-                Stars: {stars}
-                Forks: {forks}
-                Created: {created_at}
-                Last updated: {updated_at}
-                Related projects by this developer using same language: {related_projects_count}
-                
-                Write a professional, concise project description for a CV:""")
-            ])
-            
-            # Generate response
-            chain = prompt | llm | StrOutputParser()
-            description = chain.invoke(context)
-            return description.strip()
+            # Generate response (memoized per repo state)
+            return describe_project(project['id'], context), False
             
         except Exception as e:
-            print(f"LLM description generation failed: {e}")
+            logger.warning("LLM description generation failed: %s", e)
             # Fall back to template approach
+            return fallback_project_description(context), True
+    
+    return fallback_project_description(context), False
+
+def stream_project_description(project, language_totals):
+    """Yield (chunk, llm_failed) pairs for a project description as the LLM produces it
+
+    A pair with llm_failed set carries the complete template fallback, which
+    replaces any partial text already yielded for this project.
+    """
+    context = description_context(project, language_totals)
     
-    # Fallback template-based approach if LLM fails or is unavailable
+    if description_chain:
+        # A memoized description is sent whole instead of calling Groq again
+        key = description_cache_key(project['id'], context)
+        description = get_cached_description(key)
+        if description is not None:
+            yield description, False
+            return
+        
+        chunks = []
+        try:
+            for chunk in description_chain.stream(context):
+                chunks.append(chunk)
+                yield chunk, False
+            description = "".join(chunks).strip()
+            if description:
+                set_cached_description(key, description)
+            else:
+                yield fallback_project_description(context), True
+            return
+        except Exception as e:
+            logger.warning("LLM description streaming failed: %s", e)
+            yield fallback_project_description(context), True
+            return
+    
+    yield fallback_project_description(context), False
+
+def fallback_project_description(context):
+    """Build a template-based description when the LLM fails or is unavailable"""
     # Using same logic as the frontend simulation but on the backend
-    has_stars = project_data['stars'] > 0
-    has_forks = project_data['forks'] > 0
-    has_expertise = expertise_level > 2
+    has_stars = context['stars'] > 0
+    has_forks = context['forks'] > 0
+    has_expertise = context['related_projects_count'] > 2
     
     # Check if project was recently updated
-    from datetime import datetime, timedelta
     try:
-        updated_date = datetime.strptime(project_data['updated_at'], "%Y-%m-%dT%H:%M:%SZ")
-        is_recent = (datetime.now() - updated_date) < timedelta(days=90)
-    except:
+        updated_date = parse_github_date(context['updated_at'])
+        is_recent = (datetime.now(timezone.utc) - updated_date) < timedelta(days=90)
+    except (ValueError, AttributeError):  # Malformed or missing (null) timestamp
         is_recent = False
     
     descriptions = []
     
     # Technical description
-    tech_desc = f"Developed a {project_data['description']} using {project_data['language']}"
+    tech_desc = f"Developed a {context['description']} using {context['language']}"
     descriptions.append(tech_desc)
     
     # Achievements
     if has_stars:
-        descriptions.append(f"Gained recognition with {project_data['stars']} stars on GitHub")
+        descriptions.append(f"Gained recognition with {context['stars']} stars on GitHub")
     
     # Collaboration
     if has_forks:
-        descriptions.append(f"Created code that was forked {project_data['forks']} times by other developers")
+        descriptions.append(f"Created code that was forked {context['forks']} times by other developers")
     
     # Expertise
     if has_expertise:
-        descriptions.append(f"Applied specialized {project_data['language']} skills developed across multiple projects")
+        descriptions.append(f"Applied specialized {context['language']} skills developed across multiple projects")
     
     # Activity
     if is_recent:
@@ -202,24 +551,121 @@ def generate_project_description(project, all_repos):
     
     return " ".join(descriptions)
 
+def sse_event(event, data):
+    """Format a server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+@app.route('/api/github-profile/stream', methods=['GET'])
+def stream_github_profile():
+    """Stream GitHub profile data for a user, sending descriptions as they are generated"""
+    github_username = request.args.get('username')
+    
+    if not github_username:
+        return ojsonify({'error': 'GitHub username is required'}, 400)
+    
+    def cached_events(entry):
+        # A cached profile already contains the finished descriptions
+        yield sse_event('profile', orjson.loads(entry['body']))
+        yield sse_event('done', {})
+    
+    def event_stream(events):
+        return Response(events, mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+    
+    cached = get_cached_profile(github_username)
+    if cached and cached['stale_at'] > time.time():
+        return event_stream(cached_events(cached))
+    
+    # Fetch GitHub data before the stream starts so failures get a real HTTP status
+    try:
+        user_data, language_counts, language_totals, top_repos = get_github_data(github_username)
+    except requests.exceptions.HTTPError as e:
+        # Fall back to the last known good profile if we have one
+        if cached:
+            return event_stream(cached_events(cached))
+        return ojsonify({'error': f'GitHub API error: {str(e)}'}, 404)
+    except GitHubBudgetExhausted as e:
+        if cached:
+            return event_stream(cached_events(cached))
+        return budget_exhausted_response(e)
+    except Exception as e:
+        if cached:
+            return event_stream(cached_events(cached))
+        return ojsonify({'error': f'Error fetching GitHub data: {str(e)}'}, 500)
+    
+    def generate():
+        cv_repos = top_repos[:2]  # Process only top 2 for the CV
+        yield sse_event('profile', {
+            'user_data': user_data,
+            'top_repos': cv_repos,
+            'languages': language_counts
+        })
+        
+        top_repos_with_descriptions = []
+        any_llm_failed = False
+        for repo in cv_repos:
+            chunks = []
+            for chunk, llm_failed in stream_project_description(repo, language_totals):
+                if llm_failed:
+                    any_llm_failed = True
+                    if chunks:
+                        # The LLM broke off mid-description; tell the client to discard the partial text
+                        chunks = [chunk]
+                        yield sse_event('replace', {'id': repo['id'], 'description': chunk})
+                        continue
+                chunks.append(chunk)
+                yield sse_event('description', {'id': repo['id'], 'chunk': chunk})
+            top_repos_with_descriptions.append({**repo, 'enhanced_description': "".join(chunks).strip()})
+        
+        # Cache the finished profile exactly as /api/github-profile would
+        if not any_llm_failed:
+            set_cached_profile(github_username, 200, orjson.dumps({
+                'user_data': user_data,
+                'top_repos': top_repos_with_descriptions,
+                'languages': language_counts
+            }))
+        
+        yield sse_event('done', {})
+    
+    return event_stream(generate())
+
 @app.route('/api/generate-cv', methods=['POST'])
 def generate_cv():
     """Generate a complete CV with enhanced descriptions"""
     try:
         # Get form data and GitHub data from request
-        data = request.json
+        raw = request.get_data()
+        
+        # Validate the body, but echo the original bytes instead of re-serializing it
+        if not isinstance(orjson.loads(raw), dict):
+            return ojsonify({'error': 'CV data must be a JSON object'}, 400)
         
         # Here you could add more CV processing logic if needed
         # For example, optimizing layout, adding custom sections, etc.
         
-        return jsonify({
-            'status': 'success',
-            'message': 'CV generated successfully',
-            'data': data
-        })
+        return Response(
+            b'{"status":"success","message":"CV generated successfully","data":' + raw + b'}',
+            mimetype='application/json'
+        )
         
+    except orjson.JSONDecodeError as e:
+        return ojsonify({'error': f'Invalid CV data: {str(e)}'}, 400)
     except Exception as e:
-        return jsonify({'error': f'Error generating CV: {str(e)}'}), 500
+        return ojsonify({'error': f'Error generating CV: {str(e)}'}, 500)
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO)
+    
+    # Requests spend most of their time waiting on GitHub and Groq, so serve them
+    # from a multi-threaded production server; set FLASK_DEBUG=1 for the reloader.
+    # Only listens on localhost unless HOST is set (e.g. HOST=0.0.0.0)
+    host = os.getenv("HOST", "127.0.0.1")
+    # Parse FLASK_DEBUG the way Flask does, so "0"/"false" never enable the debugger
+    if get_debug_flag():
+        app.run(host=host, debug=True, port=5000, threaded=True)
+    else:
+        try:
+            from waitress import serve
+            serve(app, host=host, port=5000, threads=int(os.getenv("SERVER_THREADS", "32")))
+        except ImportError:
+            logger.warning("waitress is not installed, falling back to the threaded Flask server")
+            app.run(host=host, port=5000, threaded=True)